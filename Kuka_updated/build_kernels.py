@@ -0,0 +1,27 @@
+# SPDX-FileCopyrightText: Copyright (c) 2022-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Ahead-of-time compile the per-tick kernels into a `kuka_kernels` module.
+
+Run `python build_kernels.py` from this directory. The produced
+kuka_kernels.*.so/.pyd sits next to scenario.py, which imports it in
+preference to the @njit versions so the first physics tick pays no
+compile-on-first-call delay. Without the artifact the @njit(cache=True)
+fallbacks are used and behave identically.
+"""
+
+from numba.pycc import CC
+
+cc = CC("kuka_kernels")
+
+
+@cc.export("interp_targets", "void(f4[:], f4[:], f8, f4[:])")
+def interp_targets(start, end, t, target_out):
+    # Must stay in sync with scenario._interp_targets
+    smooth = t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+    for i in range(start.shape[0]):
+        target_out[i] = start[i] + (end[i] - start[i]) * smooth
+
+
+if __name__ == "__main__":
+    cc.compile()
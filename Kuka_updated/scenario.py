@@ -28,8 +28,28 @@ class ScenarioTemplate:
         pass
 
 
+import logging
+import logging.handlers
+import math
+import queue
+
 import numpy as np
+from isaacsim.core.utils.prims import create_fixed_joint, remove_fixed_joint
+from isaacsim.core.utils.stage import get_current_stage
 from isaacsim.core.utils.types import ArticulationAction
+from numba import njit
+
+# Hot-path messages go through a queue drained on a background thread so
+# the 60 Hz physics callback never blocks on console I/O
+_log = logging.getLogger(__name__)
+if not _log.handlers:
+    _log_queue = queue.SimpleQueue()
+    _log.addHandler(logging.handlers.QueueHandler(_log_queue))
+    # Debug level so the phase messages actually reach the queue; the
+    # root logger's default WARNING would silence them
+    _log.setLevel(logging.DEBUG)
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
 
 """
 This scenario makes the KUKA robot perform a pick and place operation on the cube.
@@ -43,6 +63,62 @@ The robot will move through several phases:
 """
 
 
+try:
+    # AOT-compiled per-tick kernel (see build_kernels.py): identical code,
+    # but no compile-on-first-call pause on the first physics tick
+    from .kuka_kernels import interp_targets as _interp_targets
+except ImportError:
+
+    @njit(cache=True, fastmath=True)
+    def _interp_targets(start, end, t, target_out):
+        """Smootherstep interpolation between waypoints for one physics tick.
+
+        Writes the interpolated joint targets into the preallocated output
+        buffer so the hot path allocates nothing. Velocities are left to
+        the articulation controller, which derives them from successive
+        position targets.
+        """
+        # Quintic smootherstep 6t^5 - 15t^4 + 10t^3: C2-continuous like the
+        # cosine ease it replaces, but pure polynomial - no libm call
+        smooth = t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+        for i in range(start.shape[0]):
+            target_out[i] = start[i] + (end[i] - start[i]) * smooth
+
+
+@njit(cache=True, fastmath=True)
+def _fk_end_effector(q, axes, offsets, out):
+    """Serial-chain forward kinematics over all joints.
+
+    Walks the chain once, composing each joint's rotation (Rodrigues form
+    about its axis) with the accumulated transform and adding the link
+    offset, so every joint contributes to the end-effector position.
+    axes is (n, 3) unit joint axes in the parent frame; offsets is
+    (n+1, 3) link translations, row 0 being the base offset.
+    """
+    R = np.eye(3)
+    p = offsets[0].copy()
+    for i in range(q.shape[0]):
+        x, y, z = axes[i, 0], axes[i, 1], axes[i, 2]
+        c = math.cos(q[i])
+        s = math.sin(q[i])
+        t = 1.0 - c
+        Rj = np.empty((3, 3))
+        Rj[0, 0] = t * x * x + c
+        Rj[0, 1] = t * x * y - s * z
+        Rj[0, 2] = t * x * z + s * y
+        Rj[1, 0] = t * x * y + s * z
+        Rj[1, 1] = t * y * y + c
+        Rj[1, 2] = t * y * z - s * x
+        Rj[2, 0] = t * x * z - s * y
+        Rj[2, 1] = t * y * z + s * x
+        Rj[2, 2] = t * z * z + c
+        R = R @ Rj
+        p = p + R @ offsets[i + 1]
+    out[0] = p[0]
+    out[1] = p[1]
+    out[2] = p[2]
+
+
 class ExampleScenario(ScenarioTemplate):
     def __init__(self):
         self._object = None
@@ -54,6 +130,7 @@ class ExampleScenario(ScenarioTemplate):
         self._phase = 0  # Current phase of pick and place
         self._phase_time = 0.0  # Time in current phase
         self._phase_duration = 2.0  # Duration for each phase (seconds)
+        self._inv_phase_duration = 1.0 / self._phase_duration
         
         # Joint configurations for different poses
         self._home_position = None
@@ -66,6 +143,19 @@ class ExampleScenario(ScenarioTemplate):
         self._cube_grasped = False
         self._initial_cube_position = None
 
+        # (message, cube grasped) per phase, looked up once on each phase
+        # change; the grasp flag is the absolute state for that phase
+        self._phase_transition_table = (
+            ("Phase 0: Moving to pre-grasp position", False),
+            ("Phase 1: Moving to grasp position", False),
+            ("Phase 2: Grasping cube", True),
+            ("Phase 3: Lifting cube", True),
+            ("Phase 4: Moving to place position", True),
+            ("Phase 5: Placing cube", False),
+            ("Phase 6: Returning home", False),
+            ("Pick and Place Complete!", False),
+        )
+
     def setup_scenario(self, articulation, object_prim):
         self._articulation = articulation
         self._object = object_prim
@@ -82,21 +172,75 @@ class ExampleScenario(ScenarioTemplate):
         # You may need to tune these positions for your specific KUKA model
         num_dof = articulation.num_dof
         
+        # All per-tick joint arrays are float32: PhysX works in float32
+        # internally, so this avoids implicit convert-and-copy at the
+        # apply_action boundary and halves the bandwidth through it.
         # Home position - all joints at neutral
-        self._home_position = np.zeros(num_dof)
-        
+        self._home_position = np.zeros(num_dof, dtype=np.float32)
+
         # Pre-grasp position - above the cube
-        self._pre_grasp_position = np.array([0.0, -0.5, 0.5, 0.0, 0.5, 0.0][:num_dof])
-        
+        self._pre_grasp_position = np.array([0.0, -0.5, 0.5, 0.0, 0.5, 0.0][:num_dof], dtype=np.float32)
+
         # Grasp position - at cube level
-        self._grasp_position = np.array([0.0, -0.3, 0.3, 0.0, 0.8, 0.0][:num_dof])
-        
+        self._grasp_position = np.array([0.0, -0.3, 0.3, 0.0, 0.8, 0.0][:num_dof], dtype=np.float32)
+
         # Lift position - cube lifted
-        self._lift_position = np.array([0.0, -0.5, 0.5, 0.0, 0.5, 0.0][:num_dof])
-        
+        self._lift_position = np.array([0.0, -0.5, 0.5, 0.0, 0.5, 0.0][:num_dof], dtype=np.float32)
+
         # Place position - move to new location
-        self._place_position = np.array([1.0, -0.3, 0.3, 0.0, 0.8, 0.0][:num_dof])
-        
+        self._place_position = np.array([1.0, -0.3, 0.3, 0.0, 0.8, 0.0][:num_dof], dtype=np.float32)
+
+        # Contiguous (num_phases+1, num_dof) waypoint table: phase p moves from
+        # row p to row p+1. Dwell phases (grasp, release) repeat their row so
+        # the interpolation collapses to a hold without special-casing.
+        self._phase_waypoints = np.ascontiguousarray(
+            np.stack([
+                self._home_position,       # phase 0 start: home
+                self._pre_grasp_position,  # phase 1 start: pre-grasp
+                self._grasp_position,      # phase 2 start: grasp (dwell)
+                self._grasp_position,      # phase 3 start: grasp
+                self._lift_position,       # phase 4 start: lift
+                self._place_position,      # phase 5 start: place (dwell)
+                self._place_position,      # phase 6 start: place
+                self._home_position,       # phase 7 start: home (hold)
+                self._home_position,
+            ]),
+            dtype=np.float32,
+        )
+
+        # Kinematic chain tables for the jitted FK: per-joint rotation axes
+        # and link offsets in each parent frame. Approximate KR210-style
+        # geometry; tune alongside the waypoint configurations above.
+        self._fk_axes = np.ascontiguousarray(
+            np.array([
+                [0.0, 0.0, 1.0],
+                [0.0, 1.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [1.0, 0.0, 0.0],
+                [0.0, 1.0, 0.0],
+                [1.0, 0.0, 0.0],
+            ][:num_dof])
+        )
+        self._fk_offsets = np.ascontiguousarray(
+            np.array([
+                [0.0, 0.0, 0.5],   # base to joint 1
+                [0.35, 0.0, 0.2],  # joint 1 to joint 2
+                [0.0, 0.0, 0.65],  # upper arm
+                [0.6, 0.0, 0.0],   # forearm
+                [0.3, 0.0, 0.0],   # wrist
+                [0.15, 0.0, 0.0],
+                [0.1, 0.0, 0.0],   # flange to end-effector
+            ][:num_dof + 1])
+        )
+
+        # Preallocated output buffer for the jitted interpolation kernel
+        self._target_buf = np.empty(num_dof, dtype=np.float32)
+        self._cube_pose_buf = np.empty(3)
+
+        # Single reusable action aliasing the kernel's output buffer; the
+        # kernel writes straight into it, so applying is allocation-free
+        self._action = ArticulationAction(joint_positions=self._target_buf)
+
         # Start at home position
         articulation.set_joint_positions(self._home_position)
         
@@ -104,6 +248,11 @@ class ExampleScenario(ScenarioTemplate):
         print("Phase 0: Moving to pre-grasp position")
 
     def teardown_scenario(self):
+        # Drop the grasp joint if we tear down mid-grasp: world.reset()
+        # alone does not clear the stage, so a stale fixed joint would keep
+        # the cube welded to the arm into the next run
+        if self._cube_grasped:
+            self._release_cube()
         self._time = 0.0
         self._phase_time = 0.0
         self._phase = 0
@@ -117,113 +266,75 @@ class ExampleScenario(ScenarioTemplate):
             return
         
         self._time += step
-        self._phase_time += step
-        
-        # Check if we should move to next phase
-        if self._phase_time >= self._phase_duration:
-            self._phase += 1
-            self._phase_time = 0.0
-            
-            if self._phase == 1:
-                print("Phase 1: Moving to grasp position")
-            elif self._phase == 2:
-                print("Phase 2: Grasping cube")
-                self._cube_grasped = True
-            elif self._phase == 3:
-                print("Phase 3: Lifting cube")
-            elif self._phase == 4:
-                print("Phase 4: Moving to place position")
-            elif self._phase == 5:
-                print("Phase 5: Placing cube")
-                self._cube_grasped = False
-            elif self._phase == 6:
-                print("Phase 6: Returning home")
-            elif self._phase >= 7:
-                print("Pick and Place Complete!")
+
+        # Phase index falls straight out of elapsed time - no accumulating
+        # per-phase timer to drift and no branch cascade on transitions
+        new_phase = int(self._time * self._inv_phase_duration)
+        self._phase_time = self._time - new_phase * self._phase_duration
+
+        if new_phase != self._phase:
+            self._phase = new_phase
+            if new_phase >= 7:
+                # __debug__ blocks are stripped at compile time under -O,
+                # leaving no bytecode for the messages in release runs
+                if __debug__:
+                    _log.debug(self._phase_transition_table[7][0])
                 self._running_scenario = False
                 return
-        
+            grasped = self._phase_transition_table[new_phase][1]
+            if __debug__:
+                _log.debug(self._phase_transition_table[new_phase][0])
+            if grasped != self._cube_grasped:
+                self._cube_grasped = grasped
+                # Attach/detach the cube once at the transition; while
+                # welded, PhysX carries it - no per-tick pose writes
+                if grasped:
+                    # The only remaining PhysX read: once per grasp, not per tick
+                    self._attach_cube(self._articulation.get_joint_positions())
+                else:
+                    self._release_cube()
+
         # Execute current phase
-        self._execute_phase(step)
-        
-        # Update cube position if grasped
-        if self._cube_grasped:
-            self._update_cube_position()
+        self._execute_phase()
 
-    def _execute_phase(self, step):
+    def _execute_phase(self):
         """Execute the current phase of the pick and place operation"""
-        
+
         # Interpolation factor (0 to 1) within current phase
-        t = min(self._phase_time / self._phase_duration, 1.0)
-        
-        # Get current joint positions
-        current_positions = self._articulation.get_joint_positions()
-        
-        # Determine target position based on phase
-        if self._phase == 0:
-            # Move from home to pre-grasp
-            target = self._interpolate_positions(self._home_position, self._pre_grasp_position, t)
-        elif self._phase == 1:
-            # Move from pre-grasp to grasp
-            target = self._interpolate_positions(self._pre_grasp_position, self._grasp_position, t)
-        elif self._phase == 2:
-            # Stay at grasp position (grasping)
-            target = self._grasp_position
-        elif self._phase == 3:
-            # Move from grasp to lift
-            target = self._interpolate_positions(self._grasp_position, self._lift_position, t)
-        elif self._phase == 4:
-            # Move from lift to place
-            target = self._interpolate_positions(self._lift_position, self._place_position, t)
-        elif self._phase == 5:
-            # Stay at place position (releasing)
-            target = self._place_position
-        elif self._phase == 6:
-            # Move from place to home
-            target = self._interpolate_positions(self._place_position, self._home_position, t)
-        else:
-            target = self._home_position
-        
-        # Apply smooth velocity control
-        velocity = (target - current_positions) / max(step, 0.001)
-        
-        # Limit velocity
-        max_velocity = 2.0  # rad/s
-        velocity = np.clip(velocity, -max_velocity, max_velocity)
-        
-        # Apply action to robot
-        action = ArticulationAction(
-            joint_positions=target,
-            joint_velocities=velocity
-        )
-        self._articulation.apply_action(action)
-
-    def _interpolate_positions(self, start, end, t):
-        """Smoothly interpolate between two joint configurations using cosine interpolation"""
-        # Cosine interpolation for smoother motion
-        smooth_t = (1 - np.cos(t * np.pi)) / 2
-        return start + (end - start) * smooth_t
-
-    def _update_cube_position(self):
-        """Update cube position to follow the robot end-effector"""
-        # Get the end-effector position (approximation using last joint)
-        # In a real scenario, you would use forward kinematics
-        
-        # Simple approach: offset cube from robot base based on joint angles
-        # This is a rough approximation - for accurate results, use proper FK
-        joint_positions = self._articulation.get_joint_positions()
-        
-        # Approximate end-effector position based on joint configuration
-        # You may need to adjust these calculations for your specific robot
-        base_x = 0.0
-        base_y = 0.0
-        base_z = 0.0
-        
-        # Simple kinematic approximation (adjust link lengths as needed)
-        reach = 1.5  # Approximate reach of robot
-        x = base_x + reach * np.sin(joint_positions[0]) * np.cos(joint_positions[1])
-        y = base_y + reach * np.cos(joint_positions[0]) * np.cos(joint_positions[1])
-        z = base_z + reach * np.sin(joint_positions[1]) + 0.5
-        
-        # Set cube position
-        self._object.set_world_pose(np.array([x, y, z]))
\ No newline at end of file
+        t = min(self._phase_time * self._inv_phase_duration, 1.0)
+
+        # Start/end configurations are adjacent rows of the waypoint table;
+        # dwell phases repeat their row, so start==end holds the pose and
+        # this path needs no per-phase special cases. update_scenario stops
+        # the scenario before the phase index can run off the table.
+        start = self._phase_waypoints[self._phase]
+        end = self._phase_waypoints[self._phase + 1]
+
+        # Interpolate into the preallocated target buffer; the controller
+        # derives joint velocities from successive position targets, so no
+        # finite-difference velocity (and its step division) is needed
+        _interp_targets(start, end, t, self._target_buf)
+
+        # Apply the reusable action (its buffer was just written in place)
+        self._articulation.apply_action(self._action)
+
+    def _attach_cube(self, joint_positions):
+        """Snap the cube to the end-effector and weld it with a fixed joint.
+
+        Once welded, PhysX carries the cube with the arm inside the physics
+        pipeline - the Python hot path no longer writes its pose each tick.
+        """
+        self._object.set_world_pose(self._end_effector_position(joint_positions))
+        stage = get_current_stage()
+        robot_prim = stage.GetPrimAtPath(self._articulation.prim_path)
+        cube_prim = stage.GetPrimAtPath(self._object.prim_path)
+        create_fixed_joint(robot_prim, cube_prim)
+
+    def _release_cube(self):
+        """Remove the grasp joint; the cube stays where physics left it."""
+        remove_fixed_joint(self._object.prim_path)
+
+    def _end_effector_position(self, joint_positions):
+        """End-effector world position via the jitted full-chain FK"""
+        _fk_end_effector(joint_positions, self._fk_axes, self._fk_offsets, self._cube_pose_buf)
+        return self._cube_pose_buf
\ No newline at end of file
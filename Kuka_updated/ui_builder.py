@@ -1,19 +1,13 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022-2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+# Heavy isaacsim/pxr imports (hundreds of ms each) are deferred into the
+# methods that first need them so the extension registers and paints its
+# UI without paying for them at module load.
 import numpy as np
 import omni.timeline
 import omni.ui as ui
-from isaacsim.core.api.objects.cuboid import FixedCuboid
-from isaacsim.core.api.world import World
-from isaacsim.core.prims import SingleArticulation, XFormPrim
-from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage, get_current_stage
-from isaacsim.gui.components.element_wrappers import CollapsableFrame, StateButton
-from isaacsim.gui.components.ui_utils import get_style
 from omni.usd import StageEventType
-from pxr import Sdf, UsdLux
-
-from .scenario import ExampleScenario
 
 
 class UIBuilder:
@@ -43,6 +37,9 @@ class UIBuilder:
             ui_elem.cleanup()
 
     def build_ui(self):
+        from isaacsim.gui.components.element_wrappers import CollapsableFrame, StateButton
+        from isaacsim.gui.components.ui_utils import get_style
+
         world_controls_frame = CollapsableFrame("World Controls", collapsed=False)
 
         with world_controls_frame:
@@ -84,10 +81,16 @@ class UIBuilder:
     def _on_init(self):
         self._articulation = None
         self._cuboid = None
-        self._scenario = ExampleScenario()
+        # Created lazily in _on_load_world; importing the scenario pulls in
+        # numba and the isaacsim core stack
+        self._scenario = None
         self._world = None
 
     def _add_light_to_stage(self):
+        from isaacsim.core.prims import XFormPrim
+        from isaacsim.core.utils.stage import get_current_stage
+        from pxr import Sdf, UsdLux
+
         sphereLight = UsdLux.SphereLight.Define(get_current_stage(), Sdf.Path("/World/SphereLight"))
         sphereLight.CreateRadiusAttr(2)
         sphereLight.CreateIntensityAttr(100000)
@@ -95,6 +98,16 @@ class UIBuilder:
 
     def _on_load_world(self):
         """Custom load function that properly manages World creation"""
+        from isaacsim.core.api.objects.cuboid import FixedCuboid
+        from isaacsim.core.api.world import World
+        from isaacsim.core.prims import SingleArticulation
+        from isaacsim.core.utils.stage import add_reference_to_stage, create_new_stage
+
+        from .scenario import ExampleScenario
+
+        if self._scenario is None:
+            self._scenario = ExampleScenario()
+
         print("\n" + "="*50)
         print("Loading KUKA Pick and Place Scenario...")
         print("="*50)
@@ -174,7 +187,7 @@ class UIBuilder:
             pass
 
     def _reset_scenario(self):
-        if self._articulation is None or self._cuboid is None:
+        if self._scenario is None or self._articulation is None or self._cuboid is None:
             print("Warning: Cannot reset scenario - objects not loaded")
             return
             
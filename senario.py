@@ -1,10 +1,18 @@
-from omni.isaac.core.prims import XFormPrim
+import math
+
+import numpy as np
+from omni.isaac.core.prims import XFormPrimView
 from omni.isaac.core.articulations import SingleArticulation
 from omni.isaac.core.utils.stage import get_current_stage
 from omni.isaac.core.utils.prims import create_fixed_joint, remove_fixed_joint
 from omni.isaac.core.articulations import ArticulationAction
 from pxr import Gf
-import time
+
+# Simulation-time seconds spent traversing each trajectory segment
+SEGMENT_DURATION = 1.0
+
+# Approach height above a cube or drop-off point
+ABOVE_OFFSET = np.array([0.0, 0.0, 0.3])
 
 class ExampleScenario:
     def __init__(self):
@@ -25,46 +33,119 @@ class ExampleScenario:
         self._robot = SingleArticulation(self._robot_path)
         self._robot.initialize()
 
-        self._cubes = [XFormPrim(path) for path in self._cube_paths]
-        for cube in self._cubes:
-            cube.initialize()
+        # One view over all cubes: a single stage traversal at init and
+        # batched pose reads/writes instead of per-prim calls
+        self._cubes_view = XFormPrimView(prim_paths_expr=self._cube_paths)
+        self._cubes_view.initialize()
 
         self._stage = get_current_stage()
 
+        # Whole-run trajectory, built once: (n_waypoints, num_dof) joint
+        # targets plus per-waypoint pick/place events. Per tick the hot
+        # path just advances a segment counter and interpolates between
+        # two adjacent rows - no per-cube Python loop and no sleeping.
+        self._all_waypoints = None
+        self._events = None
+        self._segment_idx = 0
+        self._sim_time = 0.0
+        self._done = False
+
     def setup_scenario(self):
+        self._all_waypoints = None
+        self._events = None
+        self._segment_idx = 0
+        self._sim_time = 0.0
+        self._done = False
         print("Scenario setup complete.")
 
     def teardown_scenario(self):
         print("Scenario teardown complete.")
 
-    def update_scenario(self):
-        print("Starting pick-and-place operation...")
-        for cube, target_pos in zip(self._cubes, self._target_positions):
-            cube_pos = cube.get_world_pose()[0]
-            print(f"Moving to pick cube at {cube_pos}")
-            self._move_arm_to(cube_pos)
+    def update_scenario(self, step):
+        """Advance the precomputed pick-and-place trajectory by one step.
+
+        Called from the physics callback each tick; motions are timed
+        against simulation time instead of blocking with time.sleep so
+        Kit keeps rendering while the arm moves.
+        """
+        if self._done:
+            return
 
-            print(f"Picking cube: {cube.prim_path}")
-            self._pick_cube(cube)
+        if self._all_waypoints is None:
+            self._build_trajectory()
 
-            print(f"Moving to place cube at {target_pos}")
-            self._move_arm_to(target_pos)
+        self._sim_time += step
+        segment = int(self._sim_time / SEGMENT_DURATION)
 
-            print(f"Placing cube at {target_pos}")
-            self._place_cube(cube, target_pos)
+        if segment >= self._all_waypoints.shape[0] - 1:
+            print("Pick-and-place operation complete.")
+            self._done = True
+            return
 
-    def _move_arm_to(self, position):
-        # Simulate movement with dummy joint positions
-        joint_positions = [0.5] * self._robot.num_joints
-        action = ArticulationAction(joint_positions=joint_positions)
+        # Fire the arrival event when a new segment starts
+        if segment != self._segment_idx:
+            self._segment_idx = segment
+            event = self._events[segment]
+            if event is not None:
+                kind, cube_index = event
+                if kind == "pick":
+                    print(f"Picking cube: {self._cube_paths[cube_index]}")
+                    self._pick_cube(self._cube_paths[cube_index])
+                else:
+                    print(f"Placing cube at {self._target_positions[cube_index]}")
+                    self._place_cube(cube_index)
+
+        # Linear interpolation between the two adjacent waypoint rows
+        t = self._sim_time / SEGMENT_DURATION - segment
+        start = self._all_waypoints[segment]
+        end = self._all_waypoints[segment + 1]
+        action = ArticulationAction(joint_positions=start + (end - start) * t)
         self._robot.apply_action(action)
-        time.sleep(1.0)  # Simulate time delay for movement
 
-    def _pick_cube(self, cube):
+    def _build_trajectory(self):
+        """Stack every waypoint of the four-cube run into one array."""
+        positions, _ = self._cubes_view.get_world_poses()
+
+        waypoints = [self._joint_targets_for(None)]  # start at home
+        events = [None]
+        for i, target in enumerate(self._target_positions):
+            cube_pos = positions[i]
+            target_pos = np.array(target)
+            for position, event in (
+                (cube_pos + ABOVE_OFFSET, None),
+                (cube_pos, ("pick", i)),
+                (cube_pos + ABOVE_OFFSET, None),
+                (target_pos + ABOVE_OFFSET, None),
+                (target_pos, ("place", i)),
+                (target_pos + ABOVE_OFFSET, None),
+            ):
+                waypoints.append(self._joint_targets_for(position))
+                events.append(event)
+        waypoints.append(self._joint_targets_for(None))  # return home
+        events.append(None)
+
+        self._all_waypoints = np.stack(waypoints)
+        self._events = events
+
+    def _joint_targets_for(self, position):
+        # Placeholder inverse kinematics: dummy joint positions as before,
+        # with the base joint yawed toward the goal so waypoints differ.
+        # Replace with a proper IK solve when one is available.
+        joint_positions = np.full(self._robot.num_joints, 0.5)
+        if position is not None:
+            joint_positions[0] = math.atan2(position[1], position[0])
+        else:
+            joint_positions[:] = 0.0  # home
+        return joint_positions
+
+    def _pick_cube(self, cube_path):
         robot_prim = self._stage.GetPrimAtPath(self._robot_path)
-        cube_prim = self._stage.GetPrimAtPath(cube.prim_path)
+        cube_prim = self._stage.GetPrimAtPath(cube_path)
         create_fixed_joint(robot_prim, cube_prim)
 
-    def _place_cube(self, cube, position):
-        remove_fixed_joint(cube.prim_path)
-        cube.set_world_pose(position=position)
+    def _place_cube(self, cube_index):
+        remove_fixed_joint(self._cube_paths[cube_index])
+        self._cubes_view.set_world_poses(
+            positions=np.array([self._target_positions[cube_index]]),
+            indices=[cube_index],
+        )